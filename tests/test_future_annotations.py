@@ -10,6 +10,8 @@ from __future__ import annotations
 import argparse
 from typing import Optional
 
+from typing_extensions import Literal
+
 import typed_argparse as tap
 
 
@@ -34,3 +36,10 @@ def test_parser() -> None:
         ...
 
     tap.Parser(Args).bind(run).run(raw_args=[])
+
+
+def test_get_choices_from_class() -> None:
+    class Args(tap.TypedArgs):
+        mode: Literal["a", "b"]
+
+    assert Args.get_choices_from("mode") == ["a", "b"]
@@ -350,6 +350,31 @@ def test_dynamic_defaults__mutual_exclusiveness_check() -> None:
     )
 
 
+def test_dynamic_defaults__evaluated_per_parser() -> None:
+    values = iter(["foo_value_1", "foo_value_2"])
+
+    class Args(TypedArgs):
+        foo: str = arg(dynamic_default=lambda: next(values))
+
+    args = parse(Args, [])
+    assert args.foo == "foo_value_1"
+    args = parse(Args, [])
+    assert args.foo == "foo_value_2"
+
+
+def test_defaults__copied_per_parser() -> None:
+    class Config:
+        def __init__(self, value: str = "") -> None:
+            self.items: List[str] = []
+
+    class Args(TypedArgs):
+        config: Config = arg(default=Config(), type=Config)
+
+    args = parse(Args, [])
+    args.config.items.append("mutated")
+    assert parse(Args, []).config.items == []
+
+
 # Dynamic choices
 
 
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import List, Union
 
 import pytest
 from typing_extensions import Literal
@@ -194,6 +194,61 @@ def test_subparser__aliases_support() -> None:
     assert args.y == "y_value"
 
 
+def test_subparser__same_args_in_multiple_branches() -> None:
+    class Config:
+        def __init__(self, value: str = "") -> None:
+            self.items: List[str] = []
+
+    class FooArgs(TypedArgs):
+        x: str
+        y: int = arg(default=42)
+        config: Config = arg(default=Config(), type=Config)
+
+    parser = Parser(
+        SubParserGroup(
+            SubParser("foo", FooArgs),
+            SubParser("bar", SubParserGroup(SubParser("baz", FooArgs))),
+        )
+    )
+
+    args_foo = parser.parse_args(["foo", "--x", "x_value"])
+    assert isinstance(args_foo, FooArgs)
+    assert args_foo.x == "x_value"
+    assert args_foo.y == 42
+
+    args_bar = parser.parse_args(["bar", "baz", "--x", "x_value", "--y", "1"])
+    assert isinstance(args_bar, FooArgs)
+    assert args_bar.x == "x_value"
+    assert args_bar.y == 1
+
+    # Each branch must get its own copy of the default.
+    args_foo.config.items.append("mutated")
+    assert args_bar.config.items == []
+
+
+def test_subparser__dynamic_default_in_multiple_branches() -> None:
+    values = iter(["value_1", "value_2"])
+
+    class FooArgs(TypedArgs):
+        x: str = arg(dynamic_default=lambda: next(values))
+
+    parser = Parser(
+        SubParserGroup(
+            SubParser("foo", FooArgs),
+            SubParser("bar", FooArgs),
+        )
+    )
+
+    # Dynamic defaults are evaluated per branch while building the parser.
+    args = parser.parse_args(["foo"])
+    assert isinstance(args, FooArgs)
+    assert args.x == "value_1"
+
+    args = parser.parse_args(["bar"])
+    assert isinstance(args, FooArgs)
+    assert args.x == "value_2"
+
+
 # Conflict detection
 
 
@@ -21,3 +21,30 @@ def test_runtime_generic() -> None:
 
     assert len(box) > 0
     assert box[0][0] == MyUnion
+
+
+def test_runtime_generic__forwards_keyword_arguments() -> None:
+    T = TypeVar("T")
+
+    class WithUnionType(RuntimeGeneric, Generic[T]):
+        @classmethod
+        def get_args(cls, a: int, b: int = 0) -> Any:
+            return (getattr(cls, "__args__", None), a, b)
+
+    MyUnion = Union[int, str]
+    assert WithUnionType[MyUnion].get_args(1, b=2) == ((MyUnion,), 1, 2)
+
+
+def test_runtime_generic__respects_patched_class() -> None:
+    T = TypeVar("T")
+
+    class WithUnionType(RuntimeGeneric, Generic[T]):
+        @classmethod
+        def get_args(cls) -> Any:
+            return getattr(cls, "__args__", None)
+
+    MyUnion = Union[int, str]
+    assert WithUnionType[MyUnion].get_args() == (MyUnion,)
+
+    WithUnionType.get_args = staticmethod(lambda: "patched")  # type: ignore
+    assert WithUnionType[MyUnion].get_args() == "patched"
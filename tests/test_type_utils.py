@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from enum import Enum
 from typing import List, Optional, Union
 
-from typed_argparse.type_utils import TypeAnnotation, collect_type_annotations
+from typed_argparse.type_utils import (
+    TypeAnnotation,
+    collect_type_annotations,
+    get_cached_type_annotations,
+)
 
 from ._testing_utils import starting_with_python_3_10
 
@@ -102,6 +107,21 @@ def test_type_annotation__mixed_list_optional() -> None:
     assert t.raw_type is str
 
 
+def test_type_annotation__memoized_underlyings() -> None:
+    t = TypeAnnotation(Optional[List[str]])
+    assert t.get_underlying_if_optional() is t.get_underlying_if_optional()
+
+    t = TypeAnnotation(List[str])
+    assert t.get_underlying_if_list() is t.get_underlying_if_list()
+
+    t = TypeAnnotation(Union[str, int])
+    underlyings = t.get_underlyings_if_union()
+    assert underlyings == t.get_underlyings_if_union()
+    # Mutating the returned list must not affect the memoized union.
+    underlyings.clear()
+    assert len(t.get_underlyings_if_union()) == 2
+
+
 def test_type_annotation__literals__from_typing_extensions() -> None:
     # Literal can behave differently whether it comes from typing or typing_extensions
     from typing_extensions import Literal
@@ -132,6 +152,81 @@ def test_type_annotation__literals__from_typing() -> None:
     assert t.validate(4) == (4, "value 4 does not match any allowed literal value in (1, 2, 3)")
 
 
+def test_type_annotation__list_of_types() -> None:
+    t = TypeAnnotation(List[type])
+
+    assert t.validate([int, str]) == ([int, str], None)
+    assert t.validate([int, 1]) == (
+        [int, 1],
+        "not all elements of the list have proper type (value is of type 'int', expected 'type')",
+    )
+
+
+def test_type_annotation__literals__unhashable_value() -> None:
+    from typing import Literal
+
+    t = TypeAnnotation(Literal["a", "b"])
+
+    assert t.validate("a") == ("a", None)
+    assert t.validate(["a"]) == (
+        ["a"],
+        "value ['a'] does not match any allowed literal value in ('a', 'b')",
+    )
+
+
+def test_type_annotation__enums() -> None:
+    class Color(Enum):
+        red = 1
+        green = 2
+
+    t = TypeAnnotation(Color)
+
+    assert t.validate(1) == (Color.red, None)
+    assert t.validate(Color.green) == (Color.green, None)
+    assert t.validate(3)[1] is not None
+    assert t.validate([1])[1] is not None
+
+
+def test_type_annotation__enum_converter__respects_member_order() -> None:
+    class Mixed(Enum):
+        one_int = 1
+        one_str = "1"
+
+    converter = TypeAnnotation(Mixed).get_underlying_type_converter()
+    assert converter is not None
+    assert converter("1") == Mixed.one_int
+    assert converter("one-str") == Mixed.one_str
+
+    class Strings(Enum):
+        a = "b"
+        b = "a"
+
+    converter = TypeAnnotation(Strings).get_underlying_type_converter()
+    assert converter is not None
+    assert converter("a") == Strings.a
+    assert converter("B") == Strings.a
+    assert converter("c") == "c"
+
+
+def test_type_annotation__union_with_converting_types() -> None:
+    class Color(Enum):
+        red = 1
+
+    t = TypeAnnotation(Union[str, Color, int])
+
+    assert t.validate("foo") == ("foo", None)
+    assert t.validate(1) == (Color.red, None)
+    assert t.validate(2) == (2, None)
+    assert t.validate(1.0) == (Color.red, None)
+    assert t.validate(2.0) == (
+        2.0,
+        "value 2.0 did not match any type of union:\n"
+        " - value is of type 'float', expected 'str'\n"
+        " - value 2.0 does not match any allowed enum value in (<Color.red: 1>,)\n"
+        " - value is of type 'float', expected 'int'",
+    )
+
+
 # collect_type_annotations
 
 
@@ -153,3 +248,18 @@ def test_collect_type_annotations() -> None:
 
     annotations = collect_type_annotations(Derived, include_super_types=False)
     assert set(annotations.keys()) == {"derived"}
+
+
+def test_get_cached_type_annotations() -> None:
+    class Base:
+        base: int
+
+    class Derived(Base):
+        derived: List[int]
+
+    annotations = get_cached_type_annotations(Derived)
+    assert set(annotations.keys()) == {"base", "derived"}
+    assert annotations["derived"].raw_type == List[int]
+
+    assert get_cached_type_annotations(Derived) is annotations
+    assert set(get_cached_type_annotations(Base).keys()) == {"base"}
@@ -339,6 +339,7 @@ def test_check_reserved_names() -> None:
         "__eq__",
         "__hash__",
         "__init__",
+        "__init_subclass__",
         "__module__",
         "__ne__",
         "__repr__",
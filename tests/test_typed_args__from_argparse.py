@@ -499,24 +499,33 @@ def test_union() -> None:
 
 
 def test_get_raw_args__check_for_name_collision_1() -> None:
-    class Args(TypedArgs):
-        from_argparse: str  # type: ignore   # error on purpose for testing
-
-    args_namespace = argparse.Namespace(from_argparse="foo")
     with pytest.raises(
         TypeError,
         match="A type must not have an argument called 'from_argparse'",
     ):
-        Args.from_argparse(args_namespace)  # type: ignore
 
+        class Args(TypedArgs):
+            from_argparse: str  # type: ignore   # error on purpose for testing
 
-def test_get_raw_args__check_for_name_collision_2() -> None:
-    class Args(TypedArgs):
-        get_choices_from: str  # type: ignore   # error on purpose for testing
 
-    args_namespace = argparse.Namespace(get_choices_from="foo")
+def test_get_raw_args__check_for_name_collision_2() -> None:
     with pytest.raises(
         TypeError,
         match="A type must not have an argument called 'get_choices_from'",
     ):
-        Args.from_argparse(args_namespace)
+
+        class Args(TypedArgs):
+            get_choices_from: str  # type: ignore   # error on purpose for testing
+
+
+def test_get_raw_args__check_for_name_collision_in_mixin() -> None:
+    class Mixin:
+        from_argparse: str
+
+    with pytest.raises(
+        TypeError,
+        match="A type must not have an argument called 'from_argparse'",
+    ):
+
+        class Args(TypedArgs, Mixin):  # type: ignore   # error on purpose for testing
+            x: int
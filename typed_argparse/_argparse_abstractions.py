@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import argparse
-from typing import Optional, Sequence, TypedDict
+from typing import Optional, TypedDict
 
 from typing_extensions import Protocol
 
@@ -17,11 +17,6 @@ class ArgumentParserKwArgs(TypedDict, total=False):
     formatter_class: FormatterClass
 
 
-class AddParserKwArgs(TypedDict, total=False):
-    help: str | None
-    aliases: Sequence[str]
-
-
 def create_argparse_parser(
     prog: Optional[str] = None,
     usage: Optional[str] = None,
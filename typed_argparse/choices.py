@@ -1,6 +1,11 @@
 from typing import Any, List
 
-from .type_utils import RawTypeAnnotation, TypeAnnotation, assert_not_none, typename
+from .type_utils import (
+    RawTypeAnnotation,
+    TypeAnnotation,
+    get_cached_type_annotations,
+    typename,
+)
 
 
 class Choices(List[Any]):
@@ -47,14 +52,15 @@ def get_choices_from_class(cls: type, field: str) -> Choices:
 
     Use case: Forward as `choices=...` argument to argparse.
     """
-    if field in cls.__annotations__:
-        raw_type_annotation: RawTypeAnnotation = cls.__annotations__[field]
+    annotations = get_cached_type_annotations(cls)
+    if field in annotations:
+        type_annotation = annotations[field]
         try:
-            return get_choices_from(raw_type_annotation)
+            return _get_choices_from_type_annotation(type_annotation)
         except TypeError as e:
             raise TypeError(
                 f"Could not infer literal values of field '{field}' "
-                f"of type {typename(raw_type_annotation)}"
+                f"of type {typename(type_annotation.raw_type)}"
             ) from e
     else:
         raise TypeError(f"Class {cls.__name__} doesn't have a type annotation for field '{field}'")
@@ -66,10 +72,16 @@ def get_choices_from(raw_type_annotation: RawTypeAnnotation) -> Choices:
 
     Use case: Forward as `choices=...` argument to argparse.
     """
-    type_annotation = TypeAnnotation(raw_type_annotation)
+    return _get_choices_from_type_annotation(TypeAnnotation(raw_type_annotation))
 
-    while type_annotation.get_underlying_if_list() is not None:
-        type_annotation = assert_not_none(type_annotation.get_underlying_if_list())
+
+def _get_choices_from_type_annotation(type_annotation: TypeAnnotation) -> Choices:
+    raw_type_annotation = type_annotation.raw_type
+
+    underlying_if_list = type_annotation.get_underlying_if_list()
+    while underlying_if_list is not None:
+        type_annotation = underlying_if_list
+        underlying_if_list = type_annotation.get_underlying_if_list()
 
     allowed_values = type_annotation.get_allowed_values_if_literal()
     if allowed_values is not None:
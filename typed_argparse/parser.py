@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import argparse
+import operator
 import sys
 from argparse import ArgumentParser as ArgparseParser
 from typing import (
     Any,
     Callable,
     Dict,
+    FrozenSet,
     List,
     Optional,
     Set,
@@ -19,18 +21,24 @@ from typing import (
 
 from typing_extensions import assert_never
 
-from ._argparse_abstractions import (
-    AddParserKwArgs,
-    FormatterClass,
-    create_argparse_parser,
-)
+from ._argparse_abstractions import FormatterClass, create_argparse_parser
 from .arg import Arg
 from .arg import arg as make_arg
 from .choices import Choices
 from .exceptions import SubParserConflict
-from .type_utils import TypeAnnotation, collect_type_annotations
+from .type_utils import TypeAnnotation, get_cached_type_annotations
 from .typed_args import TypedArgs
 
+try:
+    from yachalk import chalk as _chalk  # pyright: ignore
+except ImportError:
+    _chalk = None
+
+try:
+    import argcomplete as _argcomplete  # pyright: ignore
+except ImportError:
+    _argcomplete = None
+
 T = TypeVar("T", bound=TypedArgs)
 
 
@@ -168,8 +176,22 @@ class Parser:
             allow_abbrev=allow_abbrev,
             formatter_class=formatter_class,
         )
-        self._all_leaf_dest_paths = _traverse_build_parser(
-            self._args_or_group, self._argparse_parser
+        all_leaf_dest_paths = _traverse_build_parser(self._args_or_group, self._argparse_parser)
+
+        # We sort leaf paths from longer (more specific) to shorter (less specific).
+        # This should only become relevant when subparsers are non-mandatory, i.e.,
+        # then can be executable with a shorter leaf path as well. In this case we
+        # first have to check if a longer leaf path matches, otherwise it may be
+        # possible that we accidentally execute the shorter leaf path logic.
+        # Since the leaf paths only depend on the parser structure, sorting them
+        # once here avoids doing it on every `parse_args` call.
+        self._sorted_leaf_dest_paths = sorted(
+            all_leaf_dest_paths,
+            key=lambda leaf_path: len(leaf_path),
+            reverse=True,
+        )
+        self._resolve_arg_type = _make_arg_type_resolver(
+            self._sorted_leaf_dest_paths, self._type_mapping
         )
 
     def parse_args(self, raw_args: List[str] = sys.argv[1:]) -> TypedArgs:
@@ -184,9 +206,7 @@ class Parser:
         # print("Raw args:", raw_args)
         # print("Argparse namespace:", argparse_namespace)
 
-        arg_type = _determine_arg_type(
-            self._all_leaf_dest_paths, argparse_namespace, self._type_mapping
-        )
+        arg_type = self._resolve_arg_type(argparse_namespace)
 
         if arg_type is None:
             # Edge case to investigate: Probably only possible if subparsers are set to
@@ -194,7 +214,7 @@ class Parser:
             self._argparse_parser.exit(
                 message=f"Failed to extract argument type from namespace object: "
                 f"{argparse_namespace}\n"
-                f"dest paths: {self._all_leaf_dest_paths}\n"
+                f"dest paths: {self._sorted_leaf_dest_paths}\n"
                 f"type mapping: {self._type_mapping}"
             )
 
@@ -291,28 +311,30 @@ def _traverse_build_parser(
     args_or_group: ArgsOrGroup,
     parser: ArgparseParser,
     cur_dest_path: DestPath = (),
-    parent_annotations: Optional[Set[str]] = None,
+    parent_annotations: FrozenSet[str] = frozenset(),
     all_leaf_dest_paths: Optional[Set[DestPath]] = None,
+    add_argument_cache: Optional[AddArgumentCache] = None,
 ) -> Set[DestPath]:
-    if parent_annotations is None:
-        parent_annotations = set()
     if all_leaf_dest_paths is None:
         all_leaf_dest_paths = set()
+    if add_argument_cache is None:
+        add_argument_cache = {}
 
     if isinstance(args_or_group, SubParserGroup):
         group = args_or_group
 
-        # Make a copy of parent annotations to avoid leaking changes in other branches.
-        parent_annotations = parent_annotations.copy()
-
         if group._common_args is not None:
             common_args = group._common_args
-            _add_arguments(common_args, parser, parent_annotations)
+            _add_arguments(common_args, parser, parent_annotations, add_argument_cache)
 
             if not args_or_group._required:
                 all_leaf_dest_paths.add(cur_dest_path)
 
-            parent_annotations.update(collect_type_annotations(common_args).keys())
+            # Note that parent annotations are immutable, i.e., extending them here does not
+            # leak changes into other branches.
+            parent_annotations = parent_annotations.union(
+                get_cached_type_annotations(common_args).keys()
+            )
 
         # It looks like wrapping the `dest` variable for argparse into `<...>` leads to
         # well readable error message while also reducing the risk of an argument name
@@ -330,14 +352,19 @@ def _traverse_build_parser(
         )
 
         for sub_parser_declaration in group._sub_parser_declarations:
-            kwargs: AddParserKwArgs = {}
+            # Note that argparse lists sub parsers in the help output if `help` is passed
+            # at all (even if None), so we have to omit it in that case.
+            aliases = sub_parser_declaration._aliases or ()
             if sub_parser_declaration._help is not None:
-                kwargs["help"] = sub_parser_declaration._help
-            if sub_parser_declaration._aliases is not None:
-                kwargs["aliases"] = sub_parser_declaration._aliases
-            argparse_subparser = argparse_subparsers.add_parser(
-                sub_parser_declaration._name, **kwargs
-            )
+                argparse_subparser = argparse_subparsers.add_parser(
+                    sub_parser_declaration._name,
+                    help=sub_parser_declaration._help,
+                    aliases=aliases,
+                )
+            else:
+                argparse_subparser = argparse_subparsers.add_parser(
+                    sub_parser_declaration._name, aliases=aliases
+                )
 
             _traverse_build_parser(
                 sub_parser_declaration._args_or_group,
@@ -345,13 +372,13 @@ def _traverse_build_parser(
                 cur_dest_path=cur_dest_path + (dest,),
                 parent_annotations=parent_annotations,
                 all_leaf_dest_paths=all_leaf_dest_paths,
+                add_argument_cache=add_argument_cache,
             )
 
     elif issubclass(args_or_group, TypedArgs):
         arg_type = args_or_group
-        assert issubclass(arg_type, TypedArgs)
 
-        _add_arguments(arg_type, parser, parent_annotations)
+        _add_arguments(arg_type, parser, parent_annotations, add_argument_cache)
 
         all_leaf_dest_paths.add(cur_dest_path)
 
@@ -409,51 +436,94 @@ def _traverse_get_type_mapping(args_or_group: ArgsOrGroup) -> TypeMapping:
     return mapping
 
 
+ValuePathGetter = Callable[[argparse.Namespace], Tuple[str, ...]]
+
+
+def _make_value_path_getter(dest_path: DestPath) -> ValuePathGetter:
+    # Note that `operator.attrgetter` only returns a tuple if it is given more than one
+    # attribute, and cannot be constructed without any attribute at all.
+    if len(dest_path) == 0:
+        return lambda argparse_namespace: ()
+    elif len(dest_path) == 1:
+        getter = operator.attrgetter(dest_path[0])
+        return lambda argparse_namespace: (getter(argparse_namespace),)
+    else:
+        return operator.attrgetter(*dest_path)
+
+
+ArgTypeResolver = Callable[[argparse.Namespace], Optional[Type[TypedArgs]]]
+
+
+def _make_arg_type_resolver(
+    sorted_dest_paths: List[DestPath], type_mapping: TypeMapping
+) -> ArgTypeResolver:
+    # Without any sub parsers the arg type is known upfront, so we can specialize
+    # the resolver to avoid looking at the namespace at all.
+    if sorted_dest_paths == [()] and len(type_mapping) == 1 and () in type_mapping:
+        arg_type = type_mapping[()]
+        return lambda argparse_namespace: arg_type
+
+    sorted_value_path_getters = [
+        _make_value_path_getter(dest_path) for dest_path in sorted_dest_paths
+    ]
+    return lambda argparse_namespace: _determine_arg_type(
+        sorted_value_path_getters, argparse_namespace, type_mapping
+    )
+
+
 def _determine_arg_type(
-    all_leaf_dest_paths: Set[DestPath],
+    sorted_value_path_getters: List[ValuePathGetter],
     argparse_namespace: argparse.Namespace,
     type_mapping: TypeMapping,
 ) -> Optional[Type[TypedArgs]]:
-    # We sort leaf paths from longer (more specific) to shorter (less specific).
-    # This should only become relevant when subparsers are non-mandatory, i.e.,
-    # then can be executable with a shorter leaf path as well. In this case we
-    # first have to check if a longer leaf path matches, otherwise it may be
-    # possible that we accidentally execute the shorter leaf path logic.
-    sorted_dest_paths = sorted(
-        all_leaf_dest_paths,
-        key=lambda leaf_path: len(leaf_path),
-        reverse=True,
-    )
-
-    arg_type: Optional[Type[TypedArgs]] = None
-    for dest_path in sorted_dest_paths:
+    # Note that the dest paths must be sorted from longer (more specific) to
+    # shorter (less specific), see `Parser.__init__`.
+    for value_path_getter in sorted_value_path_getters:
         # Here we translate from the ('sub-command', 'sub-sub-command', ...) key-based dest path to the
         # actual value-based path of ('foo', 'x', ...) by looking up the keys in the namespace.
         try:
-            value_path: Tuple[str, ...] = tuple(
-                getattr(argparse_namespace, dest) for dest in dest_path
-            )
-            if value_path in type_mapping:
-                arg_type = type_mapping[value_path]
-                return arg_type
+            value_path = value_path_getter(argparse_namespace)
         except AttributeError:
-            pass
+            continue
+
+        arg_type = type_mapping.get(value_path)
+        if arg_type is not None:
+            return arg_type
 
     return None
 
 
+AddArgumentArgs = Tuple[List[str], Dict[str, Any]]
+AddArgumentCache = Dict[Tuple[Type[TypedArgs], str], Tuple[Arg, AddArgumentArgs]]
+
+
 def _add_arguments(
-    arg_type: Type[TypedArgs], parser: ArgparseParser, parent_annotations: Set[str]
+    arg_type: Type[TypedArgs],
+    parser: ArgparseParser,
+    parent_annotations: FrozenSet[str],
+    add_argument_cache: AddArgumentCache,
 ) -> None:
-    annotations = collect_type_annotations(arg_type)
+    annotations = get_cached_type_annotations(arg_type)
     # print(f"Adding {arg_type.__name__}, {annotations.keys() = }, {parent_annotations = }")
 
     for attr_name, annotation in annotations.items():
         if attr_name in parent_annotations:
             continue
 
+        # If the same type shows up in multiple branches of the parser tree, the
+        # arguments are identical, so we can re-use what has been built before. Only
+        # the default has to be resolved again, so that every branch gets its own copy.
+        cache_key = (arg_type, attr_name)
+        cached = add_argument_cache.get(cache_key)
+        if cached is not None:
+            arg, (args, kwargs) = cached
+            if "default" in kwargs:
+                kwargs = {**kwargs, "default": arg.resolve_default()}
+            parser.add_argument(*args, **kwargs)
+            continue
+
         if not hasattr(arg_type, attr_name):
-            arg = make_arg()
+            arg = _DEFAULT_ARG
         else:
             arg = getattr(arg_type, attr_name)
 
@@ -464,16 +534,23 @@ def _add_arguments(
             )
 
         args, kwargs = _build_add_argument_args(attr_name, annotation, arg)
+        # Dynamic defaults and choices are evaluated for every branch they appear in, so
+        # they are never cached.
+        if arg.dynamic_default is None and arg.dynamic_choices is None:
+            add_argument_cache[cache_key] = (arg, (args, kwargs))
 
         # print(f"Adding argument: {args} {kwargs}")
         parser.add_argument(*args, **kwargs)
 
 
+_DEFAULT_ARG = make_arg()
+
+
 def _build_add_argument_args(
     python_arg_name: str,
     annotation: TypeAnnotation,
     arg: Arg,
-) -> Tuple[List[str], Dict[str, Any]]:
+) -> AddArgumentArgs:
 
     kwargs: Dict[str, Any] = {
         "help": _generate_help_text(arg),
@@ -604,13 +681,9 @@ def _build_add_argument_args(
 
 def _generate_help_text(arg: Arg) -> Optional[str]:
     if arg.help is not None and arg.default is not None and arg.auto_default_help:
-
-        try:
-            from yachalk import chalk  # pyright: ignore
-
-            return f"{arg.help} {chalk.gray(f'[default: {arg.default}]')}"
-
-        except ImportError:
+        if _chalk is not None:
+            return f"{arg.help} {_chalk.gray(f'[default: {arg.default}]')}"
+        else:
             return f"{arg.help} [default: {arg.default}]"
     else:
         return arg.help
@@ -624,9 +697,5 @@ def _to_string(args_or_group: ArgsOrGroup) -> str:
 
 
 def _install_argcomplete_if_available(parser: ArgparseParser) -> None:
-    try:
-        import argcomplete  # pyright: ignore
-
-        argcomplete.autocomplete(parser)
-    except ImportError:
-        pass
+    if _argcomplete is not None:
+        _argcomplete.autocomplete(parser)
@@ -1,5 +1,4 @@
-import inspect
-import typing
+import types
 from typing import Any
 
 # Workaround for generic type erasure:
@@ -9,14 +8,15 @@ from typing import Any
 class Proxy:
     def __init__(self, generic: Any) -> None:
         object.__setattr__(self, "_generic", generic)
+        object.__setattr__(self, "_origin", generic.__origin__)
 
     def __getattr__(self, name: str) -> Any:
-        if typing._is_dunder(name):  # type: ignore # noqa
+        if name.startswith("__") and name.endswith("__"):
             return getattr(self._generic, name)
-        origin = self._generic.__origin__
-        obj = getattr(origin, name)
-        if inspect.ismethod(obj) and isinstance(obj.__self__, type):
-            return lambda *a, **kw: obj.__func__(self, *a, *kw)  # pyright: ignore
+        obj = getattr(self._origin, name)
+        if type(obj) is types.MethodType and obj.__self__ is self._origin:
+            func = obj.__func__
+            return lambda *a, **kw: func(self, *a, **kw)
         else:
             return obj
 
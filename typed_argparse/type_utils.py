@@ -1,7 +1,10 @@
+import functools
+import itertools
 import sys
 import types
+import weakref
 from enum import Enum
-from typing import Callable, Dict, List
+from typing import Callable, Dict, FrozenSet, List
 from typing import Literal as LiteralFromTyping
 from typing import Optional, Tuple, Type, TypeVar, Union, cast, get_type_hints
 
@@ -22,18 +25,39 @@ def collect_type_annotations(
     *,
     include_super_types: bool = True,
 ) -> Dict[str, "TypeAnnotation"]:
+    # The resolved annotations are memoized per class, but callers get their own dict.
     if include_super_types:
-        return _collect_all_type_annotations(cls)
+        return dict(get_cached_type_annotations(cls))
 
     else:
-        own_annotations = _collect_all_type_annotations(cls)
+        own_annotations = get_cached_type_annotations(cls)
 
         types = cls.mro()
         if len(types) > 1:
-            parent_annotations = _collect_all_type_annotations(types[1])
+            parent_annotations = get_cached_type_annotations(types[1])
             return {k: v for k, v in own_annotations.items() if k not in parent_annotations}
         else:
-            return own_annotations
+            return dict(own_annotations)
+
+
+_cached_type_annotations: "weakref.WeakKeyDictionary[type, Dict[str, TypeAnnotation]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_cached_type_annotations(cls: type) -> Dict[str, "TypeAnnotation"]:
+    """
+    Same as `collect_type_annotations(cls)`, but memoized per class.
+
+    The annotations of a class are static, so they only have to be resolved once. Resolving
+    them lazily on first use (rather than at class creation) keeps forward references working.
+    Note that the returned dict is shared and must not be mutated.
+    """
+    annotations = _cached_type_annotations.get(cls)
+    if annotations is None:
+        annotations = _collect_all_type_annotations(cls)
+        _cached_type_annotations[cls] = annotations
+    return annotations
 
 
 def _collect_all_type_annotations(cls: type) -> Dict[str, "TypeAnnotation"]:
@@ -67,24 +91,51 @@ def _get_args(t: RawTypeAnnotation) -> Tuple[RawTypeAnnotation, ...]:
 def _is_union_type(t: RawTypeAnnotation) -> bool:
     # types.UnionType only exists in Python 3.10+.
     # https://docs.python.org/3/library/stdtypes.html#types-union
+    # Note that it cannot be subclassed, so an identity check is sufficient.
     if sys.version_info >= (3, 10):
-        return isinstance(t, types.UnionType)
+        return type(t) is types.UnionType
     else:
         return False
 
 
+class _ValidationError(Exception):
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
 class TypeAnnotation:
     def __init__(self, raw_type: RawTypeAnnotation):
         self.raw_type: RawTypeAnnotation = raw_type
         self.origin = _get_origin(raw_type)
         self.args = _get_args(raw_type)
 
+        # The optional/list decompositions are needed on every validation (and for every
+        # element of a list), so we compute them once upfront.
+        self._underlying_if_optional = self._compute_underlying_if_optional()
+        self._underlying_if_list = self._compute_underlying_if_list()
+        self._expected_type = raw_type if isinstance(raw_type, type) else None
+        # Plain types (i.e., none of the special forms below) are validated by an isinstance
+        # check alone and never convert the value, which allows for some fast paths.
+        self._is_plain_type = (
+            self._expected_type is not None
+            and not (self.origin is Union or _is_union_type(raw_type))
+            and self._underlying_if_list is None
+            and self.get_allowed_values_if_literal() is None
+            and self._allowed_values_if_enum is None
+            and self._underlying_if_new_type is None
+        )
+
     @property
     def is_bool(self) -> bool:
         return self.raw_type is bool
 
     def get_underlying_type_converter(self) -> Optional[Union[type, Callable[[str], object]]]:
-        if isinstance(self.raw_type, type) and not issubclass(self.raw_type, Enum):
+        # Fast path for plain classes: Since enums have a custom metaclass, a class with
+        # metaclass `type` cannot be an enum.
+        if type(self.raw_type) is type:
+            return self.raw_type
+        elif isinstance(self.raw_type, type) and not issubclass(self.raw_type, Enum):
             return self.raw_type
         else:
             underlying = self.get_underlying_if_optional()
@@ -97,6 +148,8 @@ class TypeAnnotation:
             allowed_values_if_literal = self.get_allowed_values_if_literal()
             if allowed_values_if_literal is not None:
                 allowed_values = allowed_values_if_literal
+                if all(isinstance(allowed_value, str) for allowed_value in allowed_values):
+                    return _create_str_literal_type_converter(allowed_values)
                 return _create_literal_type_converter(allowed_values)
 
             allowed_values_if_enum = self.get_allowed_values_if_enum()
@@ -111,31 +164,52 @@ class TypeAnnotation:
 
             return None
 
+    # Note that a type annotation is immutable, so all the decompositions below are computed
+    # once per instance, and repeated calls only return the memoized result.
+
     def get_underlying_if_optional(self) -> Optional["TypeAnnotation"]:
+        return self._underlying_if_optional
+
+    def _compute_underlying_if_optional(self) -> Optional["TypeAnnotation"]:
         if self.origin is Union or _is_union_type(self.raw_type):
-            if len(self.args) == 2 and _NoneType in self.args:
-                for t in self.args:
-                    if t != _NoneType:
-                        return TypeAnnotation(t)
+            # Note that `Optional[T]` always canonicalizes to `Union[T, None]`, but we also
+            # want to support the other order.
+            args = self.args
+            if len(args) == 2:
+                if args[1] is _NoneType:
+                    return TypeAnnotation(args[0])
+                elif args[0] is _NoneType:
+                    return TypeAnnotation(args[1])
         return None
 
     def get_underlying_if_list(self) -> Optional["TypeAnnotation"]:
+        return self._underlying_if_list
+
+    def _compute_underlying_if_list(self) -> Optional["TypeAnnotation"]:
         # In Python 3.6 __origin__ was List; in Python 3.7+ __origin__ is list
         if self.origin is list and len(self.args) >= 1:
             return TypeAnnotation(self.args[0])
         return None
 
     def get_underlying_if_new_type(self) -> Optional["TypeAnnotation"]:
+        return self._underlying_if_new_type
+
+    @functools.cached_property
+    def _underlying_if_new_type(self) -> Optional["TypeAnnotation"]:
         # Using the same heuristic as pydantic: https://github.com/pydantic/pydantic/pull/223/files
         if hasattr(self.raw_type, "__name__") and hasattr(self.raw_type, "__supertype__"):
             return TypeAnnotation(getattr(self.raw_type, "__supertype__"))
         return None
 
     def get_underlyings_if_union(self) -> List["TypeAnnotation"]:
+        return list(self._underlyings_if_union)
+
+    @functools.cached_property
+    def _underlyings_if_union(self) -> Tuple["TypeAnnotation", ...]:
         if self.origin is Union or _is_union_type(self.raw_type):
-            return [TypeAnnotation(t) for t in self.args]
+            return tuple(TypeAnnotation(t) for t in self.args)
         else:
-            return []
+            return ()
 
     def get_allowed_values_if_literal(self) -> Optional[Tuple[object, ...]]:
         if self.origin is Literal or self.origin is LiteralFromTyping:
@@ -144,113 +218,221 @@ class TypeAnnotation:
             return None
 
     def get_allowed_values_if_enum(self) -> Optional[Tuple[Enum, ...]]:
+        return self._allowed_values_if_enum
+
+    @functools.cached_property
+    def _allowed_values_if_enum(self) -> Optional[Tuple[Enum, ...]]:
         if isinstance(self.raw_type, type) and issubclass(self.raw_type, Enum):
             return tuple(self.raw_type)
         else:
             return None
 
     def validate(self, value: object) -> Tuple[object, Optional[str]]:
+        try:
+            return self._validator(value), None
+        except _ValidationError as e:
+            return value, e.message
+
+    @functools.cached_property
+    def _validator(self) -> Callable[[object], object]:
+        # The kind of the type annotation is fixed, so we determine the specialized
+        # validation function once instead of re-running the dispatch on every value.
+        # Internally, validators return the (possibly converted) value and raise on errors,
+        # which keeps the common success path free of result tuples.
+        if self._is_plain_type:
+            return self._validate_type
+        elif self._underlying_if_optional is not None:
+            return _make_optional_validator(self._underlying_if_optional._validator)
+        elif len(self._underlyings_if_union) > 0:
+            return self._validate_union
+        elif self._underlying_if_list is not None:
+            return self._validate_list
+        elif self.get_allowed_values_if_literal() is not None:
+            return self._validate_literal
+        elif self._allowed_values_if_enum is not None:
+            return self._validate_enum
+        elif self._underlying_if_new_type is not None:
+            return self._underlying_if_new_type._validator
+        else:
+            return self._validate_non_type
+
+    @functools.cached_property
+    def _union_leading_plain_types(self) -> Tuple[type, ...]:
+        # Plain types never convert the value, so a leading run of them can be checked by a
+        # single isinstance call. Later plain types must still be tried in order, because
+        # earlier non-plain types may convert the value (e.g. enums).
+        leading_plain_types: List[type] = []
+        for underlying in self._underlyings_if_union:
+            if not underlying._is_plain_type:
+                break
+            assert underlying._expected_type is not None
+            leading_plain_types.append(underlying._expected_type)
+        return tuple(leading_plain_types)
+
+    def _validate_union(self, value: object) -> object:
+        leading_plain_types = self._union_leading_plain_types
+        if len(leading_plain_types) > 0 and isinstance(value, leading_plain_types):
+            return value
+
+        num_leading_plain_types = len(leading_plain_types)
+        underlyings = self._underlyings_if_union
+        errors: List[str] = []
+        for underlying in underlyings[num_leading_plain_types:]:
+            try:
+                return underlying._validator(value)
+            except _ValidationError as e:
+                errors.append(e.message)
+
+        # Validation has failed, so the errors of the plain types are needed after all.
+        leading_errors: List[str] = []
+        for underlying in underlyings[:num_leading_plain_types]:
+            try:
+                underlying._validator(value)
+            except _ValidationError as e:
+                leading_errors.append(e.message)
+        errors = leading_errors + errors
+        raise _ValidationError(
+            f"value {value} did not match any type of union:\n - " + "\n - ".join(errors)
+        )
 
-        # Handle optionals
-        underlying_if_optional = self.get_underlying_if_optional()
-        if underlying_if_optional is not None:
-            if value is None:
-                return None, None
-            else:
-                return underlying_if_optional.validate(value)
-
-        # Handle unions
-        underlyings_if_union = self.get_underlyings_if_union()
-        if len(underlyings_if_union) > 0:
-            errors: List[str] = []
-            for underlying in underlyings_if_union:
-                new_value, error = underlying.validate(value)
-                if error is None:
-                    return new_value, None
-                else:
-                    errors.append(error)
-            return (
-                value,
-                f"value {value} did not match any type of union:\n - " + "\n - ".join(errors),
-            )
+    def _validate_list(self, value: object) -> object:
+        if value is None:
+            # Coerce empty list.
+            return []
+        elif not isinstance(value, list):
+            # allowing isinstance(value, Iterable) seems too lose, because it would allow
+            # to coerce a list from string, which is not desirable.
+            raise _ValidationError(f"value is of type {typename_of(value)}, expected 'list'")
+        else:
+            # Fast path for plain element types, where validation cannot modify the elements.
+            # Mapping isinstance over the elements keeps the loop in C, without a generator.
+            element_type = self._plain_list_element_type
+            if element_type is not None and all(
+                map(isinstance, value, itertools.repeat(element_type))
+            ):
+                return list(value)
+
+            underlying_if_list = self._underlying_if_list
+            assert underlying_if_list is not None
+            validate_element = underlying_if_list._validator
+            # Validate and convert the elements in a single pass, stopping at the first error.
+            try:
+                return [validate_element(x) for x in value]
+            except _ValidationError as e:
+                raise _ValidationError(
+                    f"not all elements of the list have proper type ({e.message})"
+                ) from None
+
+    @functools.cached_property
+    def _plain_list_element_type(self) -> Optional[type]:
+        underlying_if_list = self._underlying_if_list
+        if underlying_if_list is not None and underlying_if_list._is_plain_type:
+            return underlying_if_list._expected_type
+        else:
+            return None
 
-        # Handle lists
-        underlying_if_list = self.get_underlying_if_list()
-        if underlying_if_list is not None:
-            if value is None:
-                # Coerce empty list.
-                return [], None
-            elif not isinstance(value, list):
-                # allowing isinstance(value, Iterable) seems too lose, because it would allow
-                # to coerce a list from string, which is not desirable.
-                return value, f"value is of type {typename_of(value)}, expected 'list'"
-            else:
-                new_values = []
-                for x in value:
-                    new_value, error = underlying_if_list.validate(x)
-                    if error is not None:
-                        return value, f"not all elements of the list have proper type ({error})"
-                    new_values.append(new_value)
-                return new_values, None
-
-        # Handle literals
-        allowed_values_if_literal = self.get_allowed_values_if_literal()
-        if allowed_values_if_literal is not None:
-            for allowed_value in allowed_values_if_literal:
-                if value == allowed_value:
-                    return value, None
-            return (
-                value,
-                f"value {value} does not match any allowed literal value in "
-                f"{allowed_values_if_literal}",
-            )
+    @functools.cached_property
+    def _allowed_values_set_if_literal(self) -> Optional[FrozenSet[object]]:
+        try:
+            return frozenset(self.args)
+        except TypeError:
+            # Literals may contain unhashable values, which require a linear scan.
+            return None
+
+    def _is_allowed_literal_value(self, value: object) -> bool:
+        allowed_values_set = self._allowed_values_set_if_literal
+        if allowed_values_set is not None:
+            try:
+                return value in allowed_values_set
+            except TypeError:
+                # Unhashable values have to be compared against the allowed values one by one.
+                pass
+        return any(value == allowed_value for allowed_value in self.args)
+
+    def _validate_literal(self, value: object) -> object:
+        if self._is_allowed_literal_value(value):
+            return value
+        raise _ValidationError(
+            f"value {value} does not match any allowed literal value in {self.args}"
+        )
+
+    @functools.cached_property
+    def _enum_members_by_value(self) -> Optional[Dict[object, Enum]]:
+        allowed_values_if_enum = self._allowed_values_if_enum
+        assert allowed_values_if_enum is not None
+        try:
+            return {allowed_value.value: allowed_value for allowed_value in allowed_values_if_enum}
+        except TypeError:
+            # Enums may have unhashable values, which require a linear scan.
+            return None
 
-        # Handle enums
-        allowed_values_if_enum = self.get_allowed_values_if_enum()
-        if allowed_values_if_enum is not None:
+    def _validate_enum(self, value: object) -> object:
+        allowed_values_if_enum = self._allowed_values_if_enum
+        assert allowed_values_if_enum is not None
+        members_by_value = self._enum_members_by_value
+        if members_by_value is not None:
+            try:
+                return members_by_value[value]
+            except (KeyError, TypeError):
+                pass
+            if isinstance(value, cast(Type[Enum], self.raw_type)):
+                return value
+        else:
             for allowed_value in allowed_values_if_enum:
                 if value == allowed_value.value:
-                    return allowed_value, None
+                    return allowed_value
                 elif value is allowed_value:
-                    return allowed_value, None
-            return (
-                value,
-                f"value {value} does not match any allowed enum value in "
-                f"{allowed_values_if_enum}",
-            )
-
-        # Handle new type
-        underlying_if_new_type = self.get_underlying_if_new_type()
-        if underlying_if_new_type is not None:
-            return underlying_if_new_type.validate(value)
-
-        # We have to assert self.raw_type is a true `type`
-        if not isinstance(self.raw_type, type):
-            return (
-                value,
-                f"Type annotation is of type {typename_of(self.raw_type)}, expected 'type'",
-            )
+                    return allowed_value
+        raise _ValidationError(
+            f"value {value} does not match any allowed enum value in {allowed_values_if_enum}"
+        )
 
-        if isinstance(value, self.raw_type):
-            return value, None
+    @functools.cached_property
+    def _expected_typename(self) -> str:
+        return typename(self._expected_type)
+
+    def _validate_type(self, value: object) -> object:
+        expected_type = self._expected_type
+        assert expected_type is not None
+        # The exact type check is only a pointer comparison, which avoids the more expensive
+        # isinstance check for the common case of values of exactly the expected type.
+        if type(value) is expected_type or isinstance(value, expected_type):
+            return value
         else:
-            return (
-                value,
-                f"value is of type {typename_of(value)}, expected {typename(self.raw_type)}",
+            # Note that error messages are only formatted once validation has failed.
+            raise _ValidationError(
+                f"value is of type {typename_of(value)}, expected {self._expected_typename}"
             )
 
+    def _validate_non_type(self, value: object) -> object:
+        # We have to assert self.raw_type is a true `type`
+        raise _ValidationError(
+            f"Type annotation is of type {typename_of(self.raw_type)}, expected 'type'"
+        )
+
     def validate_with_error(
         self,
         value: object,
         arg_name: str,
     ) -> object:
 
-        value, error = self.validate(value)
+        try:
+            return self._validator(value)
+        except _ValidationError as e:
+            raise TypeError(f"Failed to validate argument '{arg_name}': {e.message}") from None
+
 
-        if error is not None:
-            raise TypeError(f"Failed to validate argument '{arg_name}': {error}")
+def _make_optional_validator(
+    validate_underlying: Callable[[object], object]
+) -> Callable[[object], object]:
+    # None is accepted right away, everything else goes directly to the underlying validator.
+    def validate_optional(value: object) -> object:
+        if value is None:
+            return None
+        else:
+            return validate_underlying(value)
 
-        return value
+    return validate_optional
 
 
 T = TypeVar("T")
@@ -282,9 +464,29 @@ def _create_literal_type_converter(allowed_values: Tuple[object, ...]) -> Callab
     return converter
 
 
+def _create_str_literal_type_converter(
+    allowed_values: Tuple[object, ...]
+) -> Callable[[str], object]:
+    # For pure string literals, the fuzzy comparison boils down to comparing normalized keys,
+    # so the matching allowed value can be looked up directly. The first allowed value wins
+    # in case of ambiguities, as in the general converter.
+    normalized_allowed_values: Dict[str, object] = {}
+    for allowed_value in allowed_values:
+        assert isinstance(allowed_value, str)
+        normalized_allowed_values.setdefault(_fuzzy_normalize(allowed_value), allowed_value)
+
+    def converter(x: str) -> object:
+        return normalized_allowed_values.get(_fuzzy_normalize(x), x)
+
+    return converter
+
+
 def _create_enum_type_converter(
     allowed_values: Tuple[Enum, ...], enum_type: Type[Enum]
 ) -> Callable[[str], object]:
+    if all(isinstance(allowed_value.value, str) for allowed_value in allowed_values):
+        return _create_str_enum_type_converter(allowed_values)
+
     def converter(x: str) -> object:
 
         for allowed_value in allowed_values:
@@ -309,8 +511,30 @@ def _create_enum_type_converter(
     return converter
 
 
+def _create_str_enum_type_converter(allowed_values: Tuple[Enum, ...]) -> Callable[[str], object]:
+    # If all values are strings, matching a member by name or value boils down to comparing
+    # normalized keys. Inserting the keys in member order keeps the first matching member in
+    # case of ambiguities, as in the general converter.
+    members_by_key: Dict[str, Enum] = {}
+    for allowed_value in allowed_values:
+        assert isinstance(allowed_value.value, str)
+        members_by_key.setdefault(_fuzzy_normalize(allowed_value.name), allowed_value)
+        members_by_key.setdefault(_fuzzy_normalize(allowed_value.value), allowed_value)
+
+    def converter(x: str) -> object:
+        # Here we could raise a TypeError or ValueError, but it looks like relying
+        # on `choices` instead actually produces a better error message.
+        return members_by_key.get(_fuzzy_normalize(x), x)
+
+    return converter
+
+
+def _fuzzy_normalize(s: str) -> str:
+    return s.lower().replace("-", "_")
+
+
 def _fuzzy_compare(a: object, b: object) -> bool:
     if isinstance(a, str) and isinstance(b, str):
-        return a.lower().replace("-", "_") == b.lower().replace("-", "_")
+        return _fuzzy_normalize(a) == _fuzzy_normalize(b)
     else:
         return a == b
@@ -1,16 +1,32 @@
 import argparse
 import copy
-from typing import TYPE_CHECKING, Dict, Generic, List, Type, TypeVar, cast
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    List,
+    NamedTuple,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from typing_extensions import dataclass_transform
 
 from .arg import Arg, arg
 from .choices import Choices, get_choices_from_class
 from .runtime_generic import RuntimeGeneric
-from .type_utils import TypeAnnotation, collect_type_annotations
+from .type_utils import TypeAnnotation, get_cached_type_annotations
 
 C = TypeVar("C", bound="TypedArgs")
 
+# Sentinel to distinguish missing arguments from arguments with value None.
+_MISSING = object()
+
 
 @dataclass_transform(
     kw_only_default=True,
@@ -28,9 +44,21 @@ class TypedArgs:
 
             Validation is minimal and largely tries to follow 'dataclass transform' semantics.
             """
-            attributes = _kwargs_to_attributes(type(self), kwargs)
-            for key, value in attributes.items():
-                setattr(self, key, value)
+            # The attributes are plain instance attributes, so they can be written into the
+            # instance dict directly.
+            self.__dict__.update(_kwargs_to_attributes(type(self), kwargs))
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        # Name collisions are a property of the class definition, so they are reported here
+        # instead of on every instantiation. Only the names are needed, which means that
+        # forward references don't have to be resolved yet. Note that all bases have to be
+        # checked, because annotations may also come from mixins that aren't TypedArgs.
+        # Reading them from the class dicts avoids materializing empty annotations on bases.
+        for klass in cls.__mro__:
+            for arg_name in klass.__dict__.get("__annotations__", {}):
+                if arg_name in _RESERVED_NAMES:
+                    raise TypeError(f"A type must not have an argument called '{arg_name}'")
 
     @classmethod
     def from_argparse(
@@ -40,14 +68,15 @@ class TypedArgs:
         return cls(**kwargs)
 
     def __repr__(self) -> str:
-        key_value_pairs = [f"{k}={repr(v)}" for k, v in self.__dict__.items() if k != "_args"]
-        return f"{self.__class__.__name__}({', '.join(key_value_pairs)})"
+        key_value_pairs = ", ".join(f"{k}={v!r}" for k, v in self.__dict__.items())
+        return f"{type(self).__name__}({key_value_pairs})"
 
     def __str__(self) -> str:
         return repr(self)
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, TypedArgs):
+        # Comparing against the same class is the common case, which doesn't need an MRO walk.
+        if type(other) is type(self) or isinstance(other, TypedArgs):
             return self.__dict__ == other.__dict__
         else:
             return NotImplemented
@@ -65,33 +94,75 @@ class TypedArgs:
         return get_choices_from_class(cls, field)
 
 
+# Arguments must not shadow any of the members of TypedArgs.
+_RESERVED_NAMES = frozenset(TypedArgs.__dict__)
+
+
+class _Field(NamedTuple):
+    name: str
+    name_with_hyphen: str
+    validate_with_error: Callable[[object, str], object]
+    default: object
+
+
+class _ClassSpec(NamedTuple):
+    fields: List[_Field]
+    field_names: FrozenSet[str]
+
+
+_cached_class_specs: "weakref.WeakKeyDictionary[type, _ClassSpec]" = weakref.WeakKeyDictionary()
+
+
+def _get_class_spec(cls: Type[C]) -> _ClassSpec:
+    """
+    Returns the per-field plan of a TypedArgs type (names, validators, and defaults), which only
+    has to be computed once per class.
+    """
+    spec = _cached_class_specs.get(cls)
+    if spec is None:
+        fields = []
+        for arg_name, type_annotation in get_cached_type_annotations(cls).items():
+            default = getattr(cls, arg_name, _MISSING)
+            if isinstance(default, Arg):
+                default = default.default
+            fields.append(
+                _Field(
+                    name=arg_name,
+                    name_with_hyphen=arg_name.replace("_", "-"),
+                    validate_with_error=type_annotation.validate_with_error,
+                    default=default,
+                )
+            )
+        spec = _ClassSpec(fields=fields, field_names=frozenset(field.name for field in fields))
+        _cached_class_specs[cls] = spec
+    return spec
+
+
 def _argparse_namespace_to_dict(
     cls: Type[C], args: argparse.Namespace, disallow_extra_args: bool
 ) -> Dict[str, object]:
     missing_args: List[str] = []
 
-    annotations = collect_type_annotations(cls, include_super_types=True)
+    spec = _get_class_spec(cls)
 
     kwargs = {}
 
-    for arg_name, type_annotation in annotations.items():
-        if arg_name in TypedArgs.__dict__:
-            raise TypeError(f"A type must not have an argument called '{arg_name}'")
+    # A namespace stores its values as plain instance attributes, so the dict can be used
+    # directly instead of going through hasattr/getattr.
+    args_dict = args.__dict__
 
-        # Validate the value and add as attribute
-        if hasattr(args, arg_name):
-            value: object = getattr(args, arg_name)
-            value = type_annotation.validate_with_error(value, arg_name)
-            kwargs[arg_name] = value
-        else:
-            arg_name_with_hyphen = arg_name.replace("_", "-")
-            if hasattr(args, arg_name_with_hyphen):
-                value = getattr(args, arg_name_with_hyphen)
-                value = type_annotation.validate_with_error(value, arg_name)
-                kwargs[arg_name] = value
+    for field in spec.fields:
+        arg_name = field.name
 
-            else:
+        value = args_dict.get(arg_name, _MISSING)
+        if value is _MISSING:
+            value = args_dict.get(field.name_with_hyphen, _MISSING)
+            if value is _MISSING:
                 missing_args.append(arg_name)
+                continue
+
+        # Validate the value and add as attribute
+        kwargs[arg_name] = field.validate_with_error(value, arg_name)
 
     # Report missing args if any
     if len(missing_args) > 0:
@@ -102,8 +173,9 @@ def _argparse_namespace_to_dict(
 
     # Report extra args if any
     if disallow_extra_args:
-        extra_args = sorted(set(args.__dict__.keys()) - set(annotations.keys()))
-        if len(extra_args) > 0:
+        extra_args_set = args_dict.keys() - spec.field_names
+        if len(extra_args_set) > 0:
+            extra_args = sorted(extra_args_set)
             if len(extra_args) == 1:
                 raise TypeError(
                     f"Arguments object has an unexpected extra argument '{extra_args[0]}'"
@@ -116,19 +188,15 @@ def _argparse_namespace_to_dict(
 
 def _kwargs_to_attributes(cls: Type[C], kwargs: Dict[str, object]) -> Dict[str, object]:
 
-    annotations = collect_type_annotations(cls, include_super_types=True)
-
     attributes = {}
 
-    for arg_name in annotations.keys():
-        if arg_name in kwargs:
-            attributes[arg_name] = kwargs[arg_name]
-        elif hasattr(cls, arg_name):
-            class_attribute = getattr(cls, arg_name)
-            if isinstance(class_attribute, Arg):
-                attributes[arg_name] = copy.deepcopy(class_attribute.default)
-            else:
-                attributes[arg_name] = copy.deepcopy(class_attribute)
+    for field in _get_class_spec(cls).fields:
+        value = kwargs.get(field.name, _MISSING)
+        if value is not _MISSING:
+            attributes[field.name] = value
+        elif field.default is not _MISSING:
+            # Every instance gets its own copy of mutable defaults.
+            attributes[field.name] = copy.deepcopy(field.default)
 
     return attributes
 
@@ -150,20 +218,21 @@ def validate_type_union(args: argparse.Namespace, type_union: object) -> object:
     """
     type_annotation = TypeAnnotation(type_union)
 
-    errors = []
+    # The errors are only formatted once all sub types have failed.
+    errors: List[TypeError] = []
 
     for sub_type in type_annotation.get_underlyings_if_union():
         if isinstance(sub_type.raw_type, type) and issubclass(sub_type.raw_type, TypedArgs):
             try:
                 typed_args_class = cast(TypedArgs, sub_type.raw_type)
                 return typed_args_class.from_argparse(args)
-            except Exception as e:
-                errors.append(str(e))
+            except TypeError as e:
+                errors.append(e)
 
     if len(errors) == 0:
         raise TypeError(f"Type union {type_union} did not contain any sub types of type TypedArgs.")
     else:
-        errors_str = "\n".join([f" - {error}" for error in errors])
+        errors_str = "\n".join(f" - {error}" for error in errors)
         raise TypeError(f"Validation failed against all sub types of union type:\n{errors_str}")
 
 
@@ -174,7 +243,9 @@ class WithUnionType(RuntimeGeneric, Generic[T]):
 
     @classmethod
     def validate(cls, args: argparse.Namespace) -> T:
-        generic_args = TypeAnnotation(cls).args
+        # Only the generic arguments are needed, so there is no need for a full TypeAnnotation.
+        # Note that `cls` is a fresh proxy for every subscription, so caching on it wouldn't help.
+        generic_args = cast(Tuple[object, ...], getattr(cls, "__args__", ()))
         # Should be impossible to violate, because the Python interpreter already checks
         # that the number of specified generics is correct.
         assert (